@@ -64,9 +64,7 @@ def create_yaw_cache_alias(suffix: str) -> dict[str, Any]:
     dict
         Mapping from original to aliased in- and output tags.
     """
-    keys_in = (key for key, _ in YawCacheCreate.inputs)
-    keys_out = (key for key, _ in YawCacheCreate.outputs)
-    return {key: f"{key}_{suffix}" for key in chain(keys_in, keys_out)}
+    return {key: f"{key}_{suffix}" for key in YawCacheCreate.alias_keys}
 
 
 def create_yaw_autocorrelate_alias(suffix: str) -> dict[str, Any]:
@@ -86,9 +84,7 @@ def create_yaw_autocorrelate_alias(suffix: str) -> dict[str, Any]:
     dict
         Mapping from original to aliased in- and output tags.
     """
-    keys_in = (key for key, _ in YawAutoCorrelate.inputs)
-    keys_out = (key for key, _ in YawAutoCorrelate.outputs)
-    return {key: f"{key}_{suffix}" for key in chain(keys_in, keys_out)}
+    return {key: f"{key}_{suffix}" for key in YawAutoCorrelate.alias_keys}
 
 
 class YawCacheCreate(
@@ -132,6 +128,8 @@ class YawCacheCreate(
     outputs = [
         ("output", YawCacheHandle),
     ]
+    alias_keys = tuple(key for key, _ in chain(inputs, outputs))
+    """All in- and output tags, used to create aliases."""
 
     def create(
         self,
@@ -240,6 +238,8 @@ class YawAutoCorrelate(
     outputs = [
         ("output", YawCorrFuncHandle),
     ]
+    alias_keys = tuple(key for key, _ in chain(inputs, outputs))
+    """All in- and output tags, used to create aliases."""
 
     def correlate(self, sample: YawCacheHandle | YawCache) -> YawCorrFuncHandle:
         """
@@ -69,6 +69,8 @@ class YawCatalog:
         Path to the directory in which the data is cached.
     """
 
+    __slots__ = ("path", "catalog", "_patch_center_callback")
+
     path: str
     """Path to the directory in which the data is cached."""
     catalog: Catalog | None
@@ -127,9 +129,9 @@ class YawCatalog:
         FileNotFoundError
             If not data is cached at the specifed path.
         """
-        if not self.exists():
-            raise FileNotFoundError(f"no catalog cached at {self.path}")
-        if self.catalog is None:
+        if self.catalog is None:  # only probe the file system if not loaded
+            if not self.exists():
+                raise FileNotFoundError(f"no catalog cached at {self.path}")
             self.catalog = Catalog(self.path, max_workers=max_workers)
         return self.catalog
 
@@ -197,16 +199,19 @@ class YawCatalog:
 
         # check if any reference catalog is registered that overwrites the
         # provided patch centers
-        try:
-            patch_centers = self._patch_center_callback()
-        except (TypeError, FileNotFoundError):
-            pass
+        if self._patch_center_callback is not None:
+            try:
+                patch_centers = self._patch_center_callback()
+            except FileNotFoundError:  # referenced catalog not yet cached
+                pass
 
         if isinstance(source, (str, Path)):
             constructor = Catalog.from_file
         else:
             constructor = Catalog.from_dataframe
 
+        # unset first, the old patches are gone if the constructor fails
+        self.catalog = None
         self.catalog = constructor(
             self.path,
             source,
@@ -252,6 +257,8 @@ class YawCache:
         has to be created with the `create` method.
     """
 
+    __slots__ = ("path", "data", "rand")
+
     _flag_path = ".yaw_cache"  # file to mark a valid cache directory
     path: str
     """Path at which the data and random catalogues are cached."""
@@ -299,18 +306,19 @@ class YawCache:
         """
         normalised = normalise_path(path)
 
-        if os.path.exists(normalised):
+        try:  # fails atomically if the path exists
+            os.makedirs(normalised)
+        except FileExistsError:
             if not overwrite:
-                raise FileExistsError(normalised)
+                raise
             # check if path is valid cache directry and *only* then delete it
             try:
                 tmp_cache = cls(path)
             except FileNotFoundError as err:
                 raise OSError("can only overwrite existing cache directories") from err
             tmp_cache.drop()
-
+            os.makedirs(normalised)
         logger.info("creating new cache directory '%s'", normalised)
-        os.makedirs(normalised)
         # create the flag file
         with open(os.path.join(normalised, cls._flag_path), "w"):
             pass
@@ -360,4 +368,6 @@ class YawCache:
     def drop(self) -> None:
         """Delete the entire cache directy."""
         logger.info("dropping cache directory '%s'", self.path)
+        self.data.drop()
+        self.rand.drop()
         rmtree(self.path)
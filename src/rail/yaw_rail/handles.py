@@ -49,7 +49,7 @@ class YawCacheHandle(DataHandle):
     @classmethod
     def _read(cls, path: str, **kwargs) -> YawCache:
         with cls._open(path, **kwargs) as f:
-            path = f.read()
+            path = f.read().strip()  # tolerate trailing newlines from editors
         return YawCache(path)
 
     @classmethod
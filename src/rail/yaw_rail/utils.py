@@ -8,18 +8,21 @@ used in the wrapper stages.
 from __future__ import annotations
 
 import logging
+import os
 from abc import ABC, abstractmethod
 from functools import lru_cache, wraps
+from shutil import copyfileobj
 from typing import TYPE_CHECKING
+from urllib.request import urlopen
 
-from pandas import read_parquet
+from pyarrow import parquet
 from yaw.utils import get_logger
 
 from rail.core.stage import RailStage
 from rail.yaw_rail import stage_config
 
 if TYPE_CHECKING:
-    from collections.abc import Container
+    from collections.abc import Iterable
     from typing import Any
 
     from ceci.config import StageParameter
@@ -34,12 +37,69 @@ __all__ = [
 ]
 
 
+DC2_TEST_DATA_URL = "https://portal.nersc.gov/cfs/lsst/PZ/test_dc2_rail_yaw.pqt"
+DOWNLOAD_TIMEOUT = 60.0  # seconds
+
+
+def get_cache_dir() -> str:
+    """Get the directory used to store downloaded files, following the XDG base
+    directory specification. Can be overwritten with `RAIL_YAW_CACHE_DIR`."""
+    custom = os.environ.get("RAIL_YAW_CACHE_DIR")
+    if custom:  # empty value is treated as unset
+        return os.path.expanduser(custom)
+    root = os.environ.get("XDG_CACHE_HOME") or os.path.join("~", ".cache")
+    return os.path.join(os.path.expanduser(root), "rail_yaw")
+
+
+def download_cached(url: str, timeout: float = DOWNLOAD_TIMEOUT) -> str:
+    """
+    Download a file into the cache directory unless a copy already exists.
+
+    Parameters
+    ----------
+    url : str
+        The URL of the file to download.
+    timeout : float, optional
+        Timeout in seconds for blocking operations of the connection.
+
+    Returns
+    -------
+    str
+        Path to the local copy of the file.
+    """
+    cache_dir = get_cache_dir()
+    path = os.path.join(cache_dir, os.path.basename(url))
+    if not os.path.exists(path):
+        os.makedirs(cache_dir, exist_ok=True)
+        # download to a sibling file first to never expose partial files, open()
+        # applies the default permissions (0666 & ~umask) unlike mkstemp
+        tmp_path = f"{path}.{os.getpid()}.part"
+        try:
+            with open(tmp_path, "xb") as f:
+                with urlopen(url, timeout=timeout) as response:
+                    copyfileobj(response, f)
+            os.replace(tmp_path, path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+    return path
+
+
 @lru_cache
-def get_dc2_test_data() -> DataFrame:
+def get_dc2_test_data(
+    columns: tuple[str, ...] | None = ("ra", "dec", "z")
+) -> DataFrame:
     """
     Download a small dataset with positions and redshifts, derived from DC2.
 
     Taken from 25 sqdeg, limited to 100k objects with redshifts `0.2 <= z < 1.8`.
+    The file is downloaded once and cached on disk (see `get_cache_dir`).
+
+    Parameters
+    ----------
+    columns : tuple of str, optional
+        The subset of columns to read, all columns if `None`.
 
     Returns
     -------
@@ -47,12 +107,20 @@ def get_dc2_test_data() -> DataFrame:
         Table containing right ascension (`ra`), declination (`dec`) and
         redshift (`z`).
     """
-    return read_parquet("https://portal.nersc.gov/cfs/lsst/PZ/test_dc2_rail_yaw.pqt")
+    table = parquet.read_table(
+        download_cached(DC2_TEST_DATA_URL),
+        columns=None if columns is None else list(columns),
+        use_pandas_metadata=True,  # also read a stored index, like pandas
+    )
+    return table.to_pandas(split_blocks=True, self_destruct=True)
+
+
+_NONE_PATHS = frozenset(("none", "None", "NONE", ""))
 
 
 def handle_has_path(handle: DataHandle) -> bool:
     """This is a workaround for a peculiarity of `ceci`."""
-    return handle.path is not None and handle.path.lower() != "none"
+    return handle.path is not None and handle.path not in _NONE_PATHS
 
 
 class YawRailStage(ABC, RailStage):
@@ -88,7 +156,7 @@ class YawRailStage(ABC, RailStage):
     ... ):
     """
 
-    algo_parameters: set[str]
+    algo_parameters: frozenset[str]
     """Lists the names of all algorithm-specific parameters that were added when
     subclassing."""
 
@@ -101,16 +169,18 @@ class YawRailStage(ABC, RailStage):
             config_items = {}  # pragma: no cover
         else:
             config_items = config_items.copy()
-        cls.algo_parameters = set(config_items.keys())  # track all parameters
+        cls.algo_parameters = frozenset(config_items)  # track all parameters
 
-        cls.config_options = super().config_options.copy()
-        cls.config_options.update(config_items)  # standard RAIL practice
-        cls.config_options["verbose"] = stage_config.yaw_verbose  # used for yaw logger
+        cls.config_options = {  # standard RAIL practice
+            **super().config_options,
+            **config_items,
+            "verbose": stage_config.yaw_verbose,  # used for yaw logger
+        }
 
         super().__init_subclass__(**kwargs)  # delegate back to rail/ceci
 
     def get_algo_config_dict(
-        self, exclude: Container[str] | None = None
+        self, exclude: Iterable[str] | None = None
     ) -> dict[str, Any]:
         """
         Return the algorithm-specific configuration.
@@ -121,7 +191,7 @@ class YawRailStage(ABC, RailStage):
 
         Parameters
         ----------
-        exclude : Container of str, optional
+        exclude : Iterable of str, optional
             Listing of parameters not to include in the output.
 
         Returns
@@ -129,8 +199,7 @@ class YawRailStage(ABC, RailStage):
         dict
             Dictionary containing pairs of parameter names and (default) values.
         """
-        if exclude is None:
-            exclude = []
+        exclude = frozenset() if exclude is None else frozenset(exclude)
         return {
             key: param
             for key, param in self.get_config_dict(reduce_config=True).items()
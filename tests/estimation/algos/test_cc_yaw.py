@@ -2,7 +2,6 @@ from __future__ import annotations
 
 import inspect
 import pickle
-from pathlib import Path
 from subprocess import check_call
 
 import numpy as np
@@ -134,25 +133,21 @@ def test_cache_args(tmp_path, mock_data, mock_rand) -> None:
         ).create(data=mock_data, rand=mock_rand)
 
 
-def write_expect_ncc(path: Path) -> Path:
-    # output that the example pipeline should produce
-    # NOTE: need to update this after any changes to the algorithms
-    target_path = path / "ncc_expect.txt"
-    with open(target_path, "w") as f:
-        f.write(
-            """# n(z) estimate with symmetric 68% percentile confidence
+# output that the example pipeline should produce, columns are
 #   (z_low    z_high]         nz     nz_err
- 0.2000000  0.4000000  0.0965150  0.0895655
- 0.4000000  0.6000000  0.1000126  0.0496321
- 0.6000000  0.8000000  0.1431271  0.0520753
- 0.8000000  1.0000000  0.2423559  0.0221838
- 1.0000000  1.2000000  0.1849689  0.0735489
- 1.2000000  1.4000000  0.1879792  0.0401212
- 1.4000000  1.6000000  0.1716867  0.0822341
- 1.6000000  1.8000000  0.1856554  0.0917291
-"""
-        )
-    return target_path
+# NOTE: need to update this after any changes to the algorithms
+EXPECT_NCC = np.array(
+    [
+        [0.2000000, 0.4000000, 0.0965150, 0.0895655],
+        [0.4000000, 0.6000000, 0.1000126, 0.0496321],
+        [0.6000000, 0.8000000, 0.1431271, 0.0520753],
+        [0.8000000, 1.0000000, 0.2423559, 0.0221838],
+        [1.0000000, 1.2000000, 0.1849689, 0.0735489],
+        [1.2000000, 1.4000000, 0.1879792, 0.0401212],
+        [1.4000000, 1.6000000, 0.1716867, 0.0822341],
+        [1.6000000, 1.8000000, 0.1856554, 0.0917291],
+    ]
+)
 
 
 @mark.slow
@@ -179,12 +174,8 @@ def test_ceci_pipeline(tmp_path) -> None:
         output_prefix = str(tmp_path / "output")
         ncc.to_files(output_prefix)
 
-    # compare the output with the expected result after parsing both through
-    # ASCII files to avoid potential numerical differences
-    expect_path = write_expect_ncc(tmp_path)
-    expect_data = np.loadtxt(expect_path).T
-    output_data = np.loadtxt(f"{output_prefix}.dat").T
-    for i, (col_a, col_b) in enumerate(zip(output_data, expect_data)):
-        if i == 3:  # error column differs every time since using patch_num
-            break
-        npt.assert_array_equal(col_a, col_b)
+    # compare the output with the expected result after parsing the output
+    # ASCII file to avoid potential numerical differences
+    output_data = np.loadtxt(f"{output_prefix}.dat")
+    # skip error column, differs every time since using patch_num
+    npt.assert_array_equal(output_data[:, :3], EXPECT_NCC[:, :3])
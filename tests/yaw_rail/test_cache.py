@@ -1,13 +1,12 @@
 from __future__ import annotations
 
 import os
+from shutil import rmtree
 
 import numpy as np
 from pandas import DataFrame
 from numpy.testing import assert_array_equal
-from numpy.typing import NDArray
 from pytest import fixture, raises, mark
-from yaw.catalog import Catalog
 from yaw.coordinates import AngularCoordinates
 
 from rail.yaw_rail import cache
@@ -31,7 +30,7 @@ def test_patch_centers_from_file(tmp_path):
         cache.patch_centers_from_file(path)
 
 
-@fixture(name="column_kwargs")
+@fixture(name="column_kwargs", scope="session")
 def fixture_column_kwargs() -> dict[str, str]:
     return dict(
         ra_name="ra",
@@ -45,29 +44,25 @@ def fixture_column_kwargs() -> dict[str, str]:
 N_PATCHES_COLUMN = 2
 
 
-@fixture(name="mock_data_indexed")
+@fixture(name="mock_data_indexed", scope="session")
 def fixture_mock_data_indexed(mock_data_small: DataFrame, column_kwargs) -> DataFrame:
     # take the mock data and use the unused weight column to store indices for
-    # the original order of the data points
-    mock = mock_data_small.copy()
-    col = column_kwargs["weight_name"]
-    mock[col] = np.arange(len(mock_data_small))
-    # assign objects to predicatble patch (indices)
-    mock["patch"] = np.arange(len(mock_data_small)) % N_PATCHES_COLUMN
-    return mock
+    # the original order of the data points and assign objects to predicatble
+    # patch (indices)
+    index = np.arange(len(mock_data_small))
+    return mock_data_small.assign(
+        **{column_kwargs["weight_name"]: index, "patch": index % N_PATCHES_COLUMN}
+    )
 
 
-def write_and_get_path(path: str, data: DataFrame) -> str:
-    data.to_parquet(path)
+@fixture(name="mock_data_indexed_path", scope="session")
+def fixture_mock_data_indexed_path(tmp_path_factory, mock_data_indexed) -> str:
+    # create a copy of the data set by writing to a file
+    path = tmp_path_factory.mktemp("mock_data") / "data.pqt"
+    mock_data_indexed.to_parquet(path)
     return str(path)
 
 
-def get_redshifts_ordered(cat: Catalog) -> NDArray:
-    # use the weight column to get original order (see fixture_mock_data_indexed)
-    order = np.argsort(cat.weights)
-    return cat.redshifts[order]
-
-
 def assert_coords_equal(coord1: AngularCoordinates, coord2: AngularCoordinates) -> None:
     assert_array_equal(coord1.ra, coord2.ra)
     assert_array_equal(coord1.dec, coord2.dec)
@@ -122,22 +117,36 @@ class TestYawCatalog:
         with raises(FileExistsError):
             inst.set(mock_data_indexed, patch_num=2, overwrite=False, **column_kwargs)
 
-    def test_set_num_patches(self, tmp_path, column_kwargs, mock_data_indexed):
-        # create a copy of the data set by writing to a file
-        path = write_and_get_path(tmp_path / "data.pqt", mock_data_indexed)
+    def test_set_failed(self, tmp_path, column_kwargs, mock_data_indexed, monkeypatch):
+        inst = cache.YawCatalog(tmp_path / "cat")
+        inst.set(mock_data_indexed, patch_num=2, **column_kwargs)
+        assert inst.get()
+
+        def failing_constructor(cache_directory, *args, **kwargs):
+            rmtree(cache_directory)  # old data is already deleted when overwriting
+            raise ValueError("invalid input data")
+
+        # the memoised catalog must not outlive the deleted cache directory
+        monkeypatch.setattr(cache.Catalog, "from_dataframe", failing_constructor)
+        with raises(ValueError):
+            inst.set(mock_data_indexed, patch_num=2, overwrite=True, **column_kwargs)
+        with raises(FileNotFoundError):
+            inst.get()
 
+    def test_set_num_patches(
+        self, tmp_path, column_kwargs, mock_data_indexed, mock_data_indexed_path
+    ):
         inst = cache.YawCatalog(tmp_path / "cache")
-        for data_source in [mock_data_indexed, path]:
+        for data_source in [mock_data_indexed, mock_data_indexed_path]:
             inst.set(data_source, patch_num=2, **column_kwargs, overwrite=True)
             assert inst.get().num_patches == 2
 
-    def test_set_patch_name(self, tmp_path, mock_data_indexed, column_kwargs):
-        # create a copy of the data set by writing to a file
-        path = write_and_get_path(tmp_path / "data.pqt", mock_data_indexed)
-
+    def test_set_patch_name(
+        self, tmp_path, mock_data_indexed, mock_data_indexed_path, column_kwargs
+    ):
         # use the weight column to verify that the objects land in the correct
         # patch when using the assignment based on the patch index column
-        for data_source in (mock_data_indexed, path):
+        for data_source in (mock_data_indexed, mock_data_indexed_path):
             inst = cache.YawCatalog(tmp_path / "cache")
             inst.set(data_source, patch_name="patch", **column_kwargs, overwrite=True)
             assert inst.get().num_patches == N_PATCHES_COLUMN
@@ -146,10 +155,9 @@ class TestYawCatalog:
             for i, patch in enumerate(yaw_catalog.values()):
                 assert np.all(patch.weights % N_PATCHES_COLUMN == i)
 
-    def test_set_patch_center(self, tmp_path, mock_data_indexed, column_kwargs):
-        # create a copy of the data set by writing to a file
-        path = write_and_get_path(tmp_path / "data.pqt", mock_data_indexed)
-
+    def test_set_patch_center(
+        self, tmp_path, mock_data_indexed, mock_data_indexed_path, column_kwargs
+    ):
         # create a reference set of patch centers
         inst = cache.YawCatalog(tmp_path / "cache")
         inst.set(mock_data_indexed, patch_num=4, **column_kwargs)
@@ -157,7 +165,7 @@ class TestYawCatalog:
 
         # check that the patch centers remain fixed when constructing patches
         # with the reference centers
-        for source in [mock_data_indexed, path]:
+        for source in [mock_data_indexed, mock_data_indexed_path]:
             inst.set(source, patch_centers=ref_centers, **column_kwargs, overwrite=True)
             assert_coords_equal(inst.get().get_centers(), ref_centers)
 
@@ -250,7 +258,7 @@ class TestYawCache:
             inst.rand.get().get_centers(), inst.data.get().get_centers()
         )
 
-    def test_drop(self, tmp_path):
+    def test_drop(self, tmp_path, mock_data_indexed, column_kwargs):
         path = tmp_path / "cache"
         inst = cache.YawCache.create(path)
         assert path.exists()
@@ -258,3 +266,11 @@ class TestYawCache:
         assert str(path) in str(inst)  # test __str__()
         inst.drop()
         assert not path.exists()
+
+        # the memoised catalogs must be reset as well
+        inst = cache.YawCache.create(path)
+        inst.data.set(mock_data_indexed, patch_num=2, **column_kwargs)
+        assert inst.data.get()
+        inst.drop()
+        with raises(FileNotFoundError):
+            inst.data.get()
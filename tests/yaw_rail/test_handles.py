@@ -22,3 +22,13 @@ def test_TestYawCacheHandle(tmp_path):
 
     handle.write()  # ._write()
     assert handle.read(force=True).path == c.path  # ._open(), ._read()
+
+
+def test_TestYawCacheHandle_newline(tmp_path):
+    path = tmp_path / "cache.path"
+    c = cache.YawCache.create(tmp_path / "cache")
+    with open(path, "w") as f:
+        f.write(f"{c.path}\n")
+
+    handle = handles.YawCacheHandle("cache", path=path)
+    assert handle.read(force=True).path == c.path
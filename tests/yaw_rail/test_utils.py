@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import os
+
 from ceci.stage import StageParameter
 from pandas import DataFrame
 from pytest import mark, raises
@@ -54,7 +56,14 @@ def make_stage_with_input() -> StageTester:
 
 
 @mark.parametrize(
-    "value,expect", [("/some/path", True), ("None", False), (None, False)]
+    "value,expect",
+    [
+        ("/some/path", True),
+        ("None", False),
+        ("none", False),
+        ("", False),
+        (None, False),
+    ],
 )
 def test_handle_has_path(value, expect):
     class DummyHandle:
@@ -64,6 +73,38 @@ def test_handle_has_path(value, expect):
     assert utils.handle_has_path(dummy) == expect
 
 
+def test_get_cache_dir(tmp_path, monkeypatch):
+    monkeypatch.delenv("RAIL_YAW_CACHE_DIR", raising=False)
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    assert utils.get_cache_dir() == str(tmp_path / "rail_yaw")
+
+    monkeypatch.setenv("RAIL_YAW_CACHE_DIR", str(tmp_path / "custom"))
+    assert utils.get_cache_dir() == str(tmp_path / "custom")
+
+    monkeypatch.setenv("RAIL_YAW_CACHE_DIR", "")
+    assert utils.get_cache_dir() == str(tmp_path / "rail_yaw")
+
+
+def test_download_cached(tmp_path, monkeypatch):
+    monkeypatch.setenv("RAIL_YAW_CACHE_DIR", str(tmp_path / "cache"))
+    source = tmp_path / "source.txt"
+    source.write_text("content")
+
+    path = utils.download_cached(source.as_uri())
+    assert path.startswith(utils.get_cache_dir())
+    with open(path) as f:
+        assert f.read() == "content"
+    # must have the default permissions, same as any newly created file
+    reference = tmp_path / "reference.txt"
+    reference.touch()
+    assert os.stat(path).st_mode & 0o777 == reference.stat().st_mode & 0o777
+    assert not any(name.endswith(".part") for name in os.listdir(tmp_path / "cache"))
+
+    # the second call must be served from the cache directory
+    source.unlink()
+    assert utils.download_cached(source.as_uri()) == path
+
+
 class TestYawRailStage:
     def test_init_subclass(self):
         assert StageTester.name == StageTester.__name__